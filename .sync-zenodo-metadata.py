@@ -12,15 +12,18 @@ Both files use the [citation file-format][1] for [person objects][2].
 [1] https://citation-file-format.github.io/
 [2] https://citation-file-format.github.io/1.0.3/specifications/#/person-objects
 """
-import json
+import os
+import shutil
 from dataclasses import dataclass
 from typing import Optional
 
 import click
-from ruamel.yaml import Loader, load
+import orjson
 
+ORCID_URL_PREFIX = "https://orcid.org/"
 
-@dataclass
+
+@dataclass(frozen=True)
 class Contributor:
     last_names: str
     first_names: str
@@ -40,7 +43,10 @@ class Contributor:
             name=f"{self.first_names} {self.last_names}", affiliation=self.affiliation
         )
         if self.orcid:
-            ret["orcid"] = self.orcid.lstrip("https://orcid.org/")
+            orcid = self.orcid
+            if orcid.startswith(ORCID_URL_PREFIX):
+                orcid = orcid[len(ORCID_URL_PREFIX) :]
+            ret["orcid"] = orcid
         return ret
 
 
@@ -56,39 +62,58 @@ class Contributor:
     "-i", "--in-place", type=bool, is_flag=True, help="Modify metadata in place."
 )
 def sync(ctx, in_place=False, check=True):
+    # Only needed once the command actually runs, not for --help.
+    from yaml import load
+
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
 
     with open("CITATION.cff", "rb") as file:
-        citation = load(file.read(), Loader=Loader)
+        citation = load(file, Loader=SafeLoader)
         authors = [
             Contributor.from_citation_author(**author) for author in citation["authors"]
         ]
 
     with open("contributors.yaml", "rb") as file:
-        contributors = load(file.read(), Loader=Loader)["contributors"]
+        contributors = load(file, Loader=SafeLoader)["contributors"]
         contributors = [
             Contributor.from_citation_author(**contributor)
             for contributor in contributors
         ]
 
     with open(".zenodo.json", "rb") as file:
-        zenodo = json.loads(file.read())
+        zenodo = orjson.loads(file.read())
         zenodo_updated = zenodo.copy()
         zenodo_updated["creators"] = [a.as_zenodo_creator() for a in authors]
+        author_set = set(authors)
         zenodo_updated["contributors"] = [
-            c.as_zenodo_creator() for c in contributors if c not in authors
+            c.as_zenodo_creator() for c in contributors if c not in author_set
         ]
         for key in ("version", "keywords"):
             zenodo_updated[key] = citation[key]
 
     def dump_json_utf8(content):
-        return json.dumps(content, sort_keys=True, indent=4, ensure_ascii=False)
+        return orjson.dumps(content, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2)
 
-    modified = dump_json_utf8(zenodo) != dump_json_utf8(zenodo_updated)
+    json_data = dump_json_utf8(zenodo_updated)
+    modified = dump_json_utf8(zenodo) != json_data
     if modified:
-        json_data = dump_json_utf8(zenodo_updated)
         if in_place:
-            with open(".zenodo.json", "wb") as file:
-                file.write((json_data + "\n").encode("utf-8"))
+            fn_tmp = f".zenodo.json.{os.getpid()}.tmp"
+            try:
+                with open(fn_tmp, "wb") as file:
+                    file.write(json_data + b"\n")
+                shutil.copymode(".zenodo.json", fn_tmp)
+            except OSError:  # clean-up
+                try:
+                    os.remove(fn_tmp)
+                except OSError:
+                    pass
+                raise
+            else:
+                os.replace(fn_tmp, ".zenodo.json")
         else:
             click.echo(json_data)
         if check:
@@ -145,3 +145,13 @@ class ProjectRandomJobBench(_ProjectBenchBase):
 
     def time_search_rich_filter(self, *params):
         len(self.project.find_jobs(self.random_job_sp))
+
+
+class ProjectCacheBench(_ProjectBenchBase):
+    def setup(self, *params):
+        super().setup(*params)
+        self.project.update_cache()
+
+    def time_read_cache(self, *params):
+        self.project._sp_cache.clear()
+        self.project._read_cache()
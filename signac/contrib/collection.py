@@ -262,37 +262,38 @@ def _find_with_index_operator(index, op, argument):
         When unknown argument is given for $type operator (When the operator is $type).
 
     """
+    # The operator argument is processed once and bound to the match function
+    # instead of being re-evaluated for every value in the index.
     if op == "$in":
 
-        def op(value, argument):
+        def match(value):
             return value in argument
 
     elif op == "$nin":
 
-        def op(value, argument):
+        def match(value):
             return value not in argument
 
     elif op == "$regex":
+        pattern = re.compile(argument)
 
-        def op(value, argument):
+        def match(value):
             if isinstance(value, str):
-                return re.search(argument, value)
+                return pattern.search(value)
             else:
                 return False
 
     elif op == "$type":
+        if argument in _TYPES:
+            t = _TYPES[argument]
+        else:
+            raise ValueError(f"Unknown argument for $type operator: '{argument}'.")
 
-        def op(value, argument):
-            if argument in _TYPES:
-                t = _TYPES[argument]
-            else:
-                raise ValueError(f"Unknown argument for $type operator: '{argument}'.")
+        def match(value):
             return isinstance(value, t)
 
     elif op == "$where":
-
-        def op(value, argument):
-            return eval(argument)(value)
+        match = eval(argument)
 
     elif op == "$near":
         rel_tol, abs_tol = 1e-9, 0.0  # default values
@@ -311,15 +312,19 @@ def _find_with_index_operator(index, op, argument):
         rel_tol = float(rel_tol)
         abs_tol = float(abs_tol)
 
-        def op(value, argument):
+        def match(value):
             return isclose(value, argument, rel_tol=rel_tol, abs_tol=abs_tol)
 
     else:
         op = getattr(operator, {"$gte": "$ge", "$lte": "$le"}.get(op, op)[1:])
+
+        def match(value):
+            return op(value, argument)
+
     matches = set()
-    for value in index:
-        if op(value, argument):
-            matches.update(index[value])
+    for value, ids in index.items():
+        if match(value):
+            matches.update(ids)
     return matches
 
 
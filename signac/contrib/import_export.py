@@ -4,7 +4,6 @@
 """Provides features for importing and exporting data."""
 
 import errno
-import json
 import logging
 import os
 import re
@@ -18,7 +17,7 @@ from tempfile import TemporaryDirectory
 from zipfile import ZIP_DEFLATED, ZipFile
 
 from .errors import DestinationExistsError, StatepointParsingError
-from .utility import _dotted_dict_to_nested_dicts, _mkdir_p
+from .utility import _dotted_dict_to_nested_dicts, _json_loads, _mkdir_p
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +76,12 @@ def _make_schema_based_path_function(jobs, exclude_keys=None, delimiter_nested="
                 paths.setdefault(job_id, list())
                 paths[job_id].extend(path_tokens)
 
+    # Join the default paths once instead of on every call.
+    default_paths = {
+        job_id: os.path.normpath(os.path.join(*tokens))
+        for job_id, tokens in paths.items()
+    }
+
     def path(job, sep=None):
         """Normalize the path.
 
@@ -102,7 +107,7 @@ def _make_schema_based_path_function(jobs, exclude_keys=None, delimiter_nested="
             if sep:
                 return os.path.normpath(sep.join(paths[job.id]))
             else:
-                return os.path.normpath(os.path.join(*paths[job.id]))
+                return default_paths[job.id]
         except KeyError:
             raise RuntimeError(
                 "Unable to determine path for job '{}'.\nThis is usually caused by a "
@@ -729,7 +734,7 @@ def _parse_workspaces(fn_manifest):
         """
         try:
             with open(os.path.join(path, fn_manifest), "rb") as file:
-                return json.loads(file.read().decode())
+                return _json_loads(file.read())
         except OSError as error:
             if error.errno != errno.ENOENT:
                 raise error
@@ -969,7 +974,7 @@ def _analyze_zipfile_for_import(zipfile, project, schema):
         # Must use forward slashes, not os.path.sep.
         fn_manifest = path + "/" + project.Job.FN_MANIFEST
         if fn_manifest in names:
-            return json.loads(zipfile.read(fn_manifest).decode())
+            return _json_loads(zipfile.read(fn_manifest))
 
     if schema is None:
         schema_function = read_sp_manifest_file
@@ -1116,7 +1121,7 @@ def _analyze_tarfile_for_import(tarfile, project, schema, tmpdir):
         fn_manifest = _tarfile_path_join(path, project.Job.FN_MANIFEST)
         try:
             with closing(tarfile.extractfile(fn_manifest)) as file:
-                return json.loads(file.read())
+                return _json_loads(file.read())
         except KeyError:
             pass
 
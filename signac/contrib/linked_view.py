@@ -61,14 +61,11 @@ def create_linked_view(project, prefix=None, job_ids=None, index=None, path=None
         prefix = "view"
 
     if index is None:
+        # The state points are aggregated by the path function below, so no
+        # separate index needs to be built here.
         if job_ids is None:
-            index = [{"_id": job.id, "sp": job.sp()} for job in project]
             jobs = list(project)
         else:
-            index = [
-                {"_id": job_id, "sp": project.open_job(id=job_id).sp()}
-                for job_id in job_ids
-            ]
             jobs = list(project.open_job(id=job_id) for job_id in job_ids)
     elif job_ids is not None:
         if not isinstance(job_ids, set):
@@ -78,8 +75,9 @@ def create_linked_view(project, prefix=None, job_ids=None, index=None, path=None
         if not job_ids.issubset({doc["_id"] for doc in index}):
             raise ValueError("Insufficient index for selected data space.")
 
-    key_list = [k for job in jobs for k in job.statepoint().keys()]
-    value_list = [v for job in jobs for v in job.statepoint().values()]
+    statepoints = [job.statepoint() for job in jobs]
+    key_list = [k for sp in statepoints for k in sp.keys()]
+    value_list = [v for sp in statepoints for v in sp.values()]
     item_list = key_list + value_list
     bad_chars = [os.sep, " ", "*"]
     bad_items = [
@@ -149,9 +147,12 @@ def _update_view(prefix, links, leaf="job"):
     )
     for path in to_update:
         os.unlink(os.path.join(prefix, path))
-    for path in chain(new, to_update):
-        dst = os.path.join(prefix, path)
-        src = os.path.relpath(links[path], os.path.split(dst)[0])
+    dsts = [os.path.join(prefix, path) for path in chain(new, to_update)]
+    # Sibling links share their parent directories, so create each one once.
+    for parent in {os.path.dirname(dst) for dst in dsts}:
+        _mkdir_p(parent)
+    for path, dst in zip(chain(new, to_update), dsts):
+        src = os.path.relpath(links[path], os.path.dirname(dst))
         _make_link(src, dst)
 
 
@@ -197,7 +198,9 @@ def _analyze_view(prefix, links, leaf="job"):
 
 
 def _make_link(src, dst):
-    """Create a symbolic link and all directories leading to it.
+    """Create a symbolic link.
+
+    The directory containing ``dst`` must already exist.
 
     Parameters
     ----------
@@ -207,7 +210,6 @@ def _make_link(src, dst):
         Destination symbolic link directory/file name.
 
     """
-    _mkdir_p(os.path.dirname(dst))
     try:
         os.symlink(src, dst, target_is_directory=True)
     except OSError as error:
@@ -42,7 +42,13 @@ from .hashing import calc_id
 from .indexing import MainCrawler, SignacProjectCrawler
 from .job import Job
 from .schema import ProjectSchema, _collect_by_type
-from .utility import _mkdir_p, _nested_dicts_to_dotted_keys, split_and_print_progress
+from .utility import (
+    _json_dumps,
+    _json_loads,
+    _mkdir_p,
+    _nested_dicts_to_dotted_keys,
+    split_and_print_progress,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -308,7 +314,7 @@ class Project:
                 raise
 
         # Internal caches
-        self._index_cache = {}
+        self._index_cache = Collection(_trust=True)
         # Note that the state point cache is a superset of the jobs in the
         # project, and its contents cannot be invalidated. The cached mapping
         # of "id: statepoint" is valid even after a job has been removed, and
@@ -1032,7 +1038,9 @@ class Project:
             elif "doc" in _root_keys(filter):
                 index = self.index(include_job_document=True)
             else:
-                index = self._sp_index()
+                # The state point index is cached together with its search
+                # indexes, so repeated searches only index new jobs.
+                return self._sp_index()._find(filter)
         else:
             warnings.warn(INDEX_DEPRECATION_WARNING, FutureWarning)
 
@@ -1236,8 +1244,8 @@ class Project:
         if fn is None:
             fn = self.fn(self.FN_STATEPOINTS)
         # See comment in write state points.
-        with open(fn) as file:
-            return json.loads(file.read())
+        with open(fn, "rb") as file:
+            return _json_loads(file.read())
 
     @deprecated(
         deprecated_in="1.8",
@@ -1278,7 +1286,9 @@ class Project:
         """Dump state points to a file.
 
         If the file already contains state points, all new state points
-        will be appended, while the old ones are preserved.
+        will be appended, while the old ones are preserved. Unless a
+        non-default ``indent`` is given, the file is not rewritten if it
+        already contains all of the given state points.
 
         See Also
         --------
@@ -1303,17 +1313,22 @@ class Project:
         except OSError as error:
             if error.errno != errno.ENOENT:
                 raise
-            tmp = {}
+            tmp = None
         if statepoints is None:
             job_ids = self._job_dirs()
             _cache = {_id: self._get_statepoint(_id) for _id in job_ids}
         else:
             _cache = {calc_id(sp): sp for sp in statepoints}
 
+        if tmp is None:
+            tmp = {}
+        elif indent == 2 and all(tmp.get(_id) == sp for _id, sp in _cache.items()):
+            logger.debug("State points file is up to date.")
+            return
         tmp.update(_cache)
         logger.debug(f"Writing state points file with {len(tmp)} entries.")
-        with open(fn, "w") as file:
-            file.write(json.dumps(tmp, indent=indent))
+        with open(fn, "wb") as file:
+            file.write(_json_dumps(tmp, indent=indent))
 
     def _register(self, _id, statepoint):
         """Register the job state point in the project state point cache.
@@ -1342,7 +1357,7 @@ class Project:
         fn_manifest = os.sep.join((self.workspace, job_id, self.Job.FN_MANIFEST))
         try:
             with open(fn_manifest, "rb") as manifest:
-                return json.loads(manifest.read().decode())
+                return _json_loads(manifest.read())
         except (OSError, ValueError) as error:
             if os.path.isdir(os.sep.join((self.workspace, job_id))):
                 logger.error(
@@ -1352,6 +1367,26 @@ class Project:
                 raise JobsCorruptedError([job_id])
             raise KeyError(job_id)
 
+    def _count_sp_cache_misses(self, num_misses):
+        """Count state point cache misses and hint at updating the cache.
+
+        Parameters
+        ----------
+        num_misses : int
+            The number of state points that were not found in the cache.
+
+        """
+        self._sp_cache_misses += num_misses
+        if (
+            not self._sp_cache_warned
+            and self._sp_cache_misses > self._sp_cache_miss_warning_threshold
+        ):
+            logger.debug(
+                "High number of state point cache misses. Consider "
+                "to update cache with the Project.update_cache() method."
+            )
+            self._sp_cache_warned = True
+
     def _get_statepoint(self, job_id, fn=None):
         """Get the state point associated with a job id.
 
@@ -1389,16 +1424,7 @@ class Project:
             return self._sp_cache[job_id]
         except KeyError:
             # State point cache missed
-            self._sp_cache_misses += 1
-            if (
-                not self._sp_cache_warned
-                and self._sp_cache_misses > self._sp_cache_miss_warning_threshold
-            ):
-                logger.debug(
-                    "High number of state point cache misses. Consider "
-                    "to update cache with the Project.update_cache() method."
-                )
-                self._sp_cache_warned = True
+            self._count_sp_cache_misses(1)
             try:
                 statepoint = self._get_statepoint_from_workspace(job_id)
                 # Update the project's state point cache from this cache miss
@@ -1974,18 +2000,48 @@ class Project:
 
         Returns
         -------
-        dict
-            Dictionary containing ids and state points in the cache.
+        :class:`~signac.contrib.collection.Collection`
+            Collection containing ids and state points in the cache.
 
         """
         job_ids = set(self._job_dirs())
-        to_add = job_ids.difference(self._index_cache)
-        to_remove = set(self._index_cache).difference(job_ids)
-        for _id in to_remove:
-            del self._index_cache[_id]
+        cached_ids = set(self._index_cache.ids)
+        to_add = job_ids.difference(cached_ids)
+        to_remove = cached_ids.difference(job_ids)
+        if to_remove:
+            # Removing documents from a collection updates every search index,
+            # so it is faster to start over with the remaining documents.
+            self._index_cache = Collection(
+                (doc for doc in self._index_cache if doc["_id"] not in to_remove),
+                _trust=True,
+            )
+        if to_add:
+            if not self._sp_cache:
+                self._read_cache()
+            uncached = to_add.difference(self._sp_cache)
+            # Starting a thread pool only pays off for many manifest files.
+            if len(uncached) > 32:
+                self._count_sp_cache_misses(len(uncached))
+
+                def _read(_id):
+                    try:
+                        return _id, self._get_statepoint_from_workspace(_id)
+                    except KeyError:
+                        # Resolved by the fallback in _get_statepoint below.
+                        return _id, None
+
+                # Overlap the latency of reading the manifest files.
+                with ThreadPool() as pool:
+                    for _id, statepoint in pool.imap_unordered(
+                        _read, uncached, chunksize=32
+                    ):
+                        if statepoint is not None:
+                            self._sp_cache[_id] = statepoint
         for _id in to_add:
-            self._index_cache[_id] = dict(sp=self._get_statepoint(_id), _id=_id)
-        return self._index_cache.values()
+            self._index_cache.__setitem__(
+                _id, dict(sp=self._get_statepoint(_id), _id=_id), _trust=True
+            )
+        return self._index_cache
 
     def _build_index(self, include_job_document=False):
         """Generate a basic state point index.
@@ -2008,7 +2064,7 @@ class Project:
                         with open(
                             os.path.join(wd, _id, self.Job.FN_DOCUMENT), "rb"
                         ) as file:
-                            doc["doc"] = json.loads(file.read().decode())
+                            doc["doc"] = _json_loads(file.read())
                     except OSError as error:
                         if error.errno != errno.ENOENT:
                             raise
@@ -2095,7 +2151,7 @@ class Project:
         start = time.time()
         try:
             with gzip.open(self.fn(self.FN_CACHE), "rb") as cachefile:
-                cache = json.loads(cachefile.read().decode())
+                cache = _json_loads(cachefile.read())
             self._sp_cache.update(cache)
         except OSError as error:
             if error.errno != errno.ENOENT:
@@ -2965,7 +3021,7 @@ class JobsCursor:
                 return column in included_columns
 
         def _flatten(d):
-            return dict(_nested_dicts_to_dotted_keys(d)) if flatten else d
+            return dict(_nested_dicts_to_dotted_keys(d, encode=None)) if flatten else d
 
         def _export_sp_and_doc(job):
             """Prefix and filter state point and document keys.
@@ -2981,11 +3037,13 @@ class JobsCursor:
                 tuple with prefixed state point or document key and values.
 
             """
-            for key, value in _flatten(job.statepoint).items():
+            # Load plain dict copies once instead of accessing the synced
+            # collections (and possibly reloading them) key by key.
+            for key, value in _flatten(job.statepoint()).items():
                 prefixed_key = sp_prefix + key
                 if usecols(prefixed_key):
                     yield prefixed_key, value
-            for key, value in _flatten(job.doc).items():
+            for key, value in _flatten(job.doc()).items():
                 prefixed_key = doc_prefix + key
                 if usecols(prefixed_key):
                     yield prefixed_key, value
@@ -5,6 +5,7 @@
 
 import argparse
 import getpass
+import json
 import logging
 import os
 import sys
@@ -13,6 +14,7 @@ import zipfile
 from collections.abc import Mapping
 from contextlib import contextmanager
 from datetime import timedelta
+from math import isfinite
 from tempfile import TemporaryDirectory
 from time import time
 
@@ -21,6 +23,18 @@ from ..version import __version__
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    ORJSON = True
+except ImportError:
+    ORJSON = False
+
+# orjson decodes integers outside of the 64-bit range as floats instead of
+# rejecting them. Such integers have at least 19 digits.
+_DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+_LONG_DIGIT_RUN = b"0" * 19
+
 
 def query_yes_no(question, default="yes"):
     """Ask a yes/no question via input() and return their answer.
@@ -288,6 +302,136 @@ def _mkdir_p(path):
         os.makedirs(path, exist_ok=True)
 
 
+def _may_contain_long_integer(data):
+    """Check whether a JSON document may contain integers exceeding 64 bits.
+
+    Only runs of 19 digits at the start of a number token are considered, so
+    that digit runs in strings such as job ids do not match. The rare false
+    positives, e.g. strings containing ``":"`` followed by 19 digits, are
+    harmless.
+
+    Parameters
+    ----------
+    data : bytes
+        The JSON document.
+
+    Returns
+    -------
+    bool
+        True if the document may contain integers exceeding 64 bits.
+
+    """
+    # Mapping all digits to "0" turns the search for digit runs into a plain
+    # substring search, which is much faster than a regular expression.
+    digits = data.translate(_DIGITS_TO_ZERO)
+    start = digits.find(_LONG_DIGIT_RUN)
+    while start != -1:
+        i = start - 1
+        if i >= 0 and data[i] == 0x2D:  # minus sign
+            i -= 1
+        while i >= 0 and data[i] in b" \t\n\r":
+            i -= 1
+        if i < 0 or data[i] in b"[:,":
+            return True
+        start = digits.find(_LONG_DIGIT_RUN, start + 1)
+    return False
+
+
+def _json_loads(data):
+    """Decode a JSON document from UTF-8 encoded bytes.
+
+    The document is decoded with :mod:`orjson` if it is available. Documents
+    that orjson rejects, e.g., those containing ``NaN``, and documents that
+    may contain integers exceeding 64 bits, which orjson would decode as
+    floats, are decoded with the standard library instead.
+
+    Parameters
+    ----------
+    data : bytes
+        The JSON document.
+
+    Returns
+    -------
+    object
+        The decoded document.
+
+    Raises
+    ------
+    ValueError
+        If the document is not valid JSON.
+
+    """
+    if ORJSON and not _may_contain_long_integer(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _contains_non_finite_float(obj):
+    """Check whether a JSON-like object contains ``NaN`` or infinity.
+
+    Parameters
+    ----------
+    obj : object
+        The object to check.
+
+    Returns
+    -------
+    bool
+        True if any float in the object is not finite.
+
+    """
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, float):
+            if not isfinite(obj):
+                return True
+        elif isinstance(obj, dict):
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+    return False
+
+
+def _json_dumps(obj, indent=None):
+    """Encode an object as a UTF-8 encoded JSON document.
+
+    The object is encoded with :mod:`orjson` if it is available and the
+    indentation is supported by orjson. Objects that orjson cannot encode
+    exactly, i.e., those containing ``NaN`` or infinity (which orjson encodes
+    as ``null``) and those that orjson rejects, e.g., because they contain
+    integers that exceed 64 bits, are encoded with the standard library
+    instead.
+
+    Parameters
+    ----------
+    obj : object
+        The object to encode.
+    indent : int
+        The indentation of the document (Default value = None).
+
+    Returns
+    -------
+    bytes
+        The encoded document.
+
+    Raises
+    ------
+    TypeError
+        If the object is not JSON serializable.
+
+    """
+    if ORJSON and indent in (None, 2) and not _contains_non_finite_float(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=indent).encode()
+
+
 def split_and_print_progress(iterable, num_chunks=10, write=None, desc="Progress: "):
     """Split the progress and prints it.
 
@@ -421,7 +565,11 @@ def _to_hashable(obj):
 
     """
     if type(obj) is list:
-        return tuple(_to_hashable(_) for _ in obj)
+        for _ in obj:
+            if type(_) is list or type(_) is dict:
+                return tuple(_to_hashable(_) for _ in obj)
+        # Lists of scalars are the common case and need no conversion.
+        return tuple(obj)
     elif type(obj) is dict:
         return _hashable_dict(obj)
     else:
@@ -450,6 +598,10 @@ def _encode_tree(x):
 def _nested_dicts_to_dotted_keys(t, encode=_encode_tree, key=None):
     """Generate tuples of key in dotted string format and value from nested dict.
 
+    The nested dicts are traversed depth-first with an explicit stack instead
+    of recursion, so the cost of yielding a value does not grow with its
+    nesting depth.
+
     Parameters
     ----------
     t : dict
@@ -457,9 +609,7 @@ def _nested_dicts_to_dotted_keys(t, encode=_encode_tree, key=None):
     encode :
         By default, values are encoded to be hashable. Use ``None`` to skip encoding.
     key : str
-        Key of root at current point in the recursion, used to
-        build up nested keys in the top-level dict through
-        multiple recursive calls (Default value = None).
+        Dotted key prefix of ``t`` (Default value = None).
 
     Yields
     ------
@@ -467,14 +617,22 @@ def _nested_dicts_to_dotted_keys(t, encode=_encode_tree, key=None):
         Tuples of dotted key and values e.g. ('a.b', 'c')
 
     """
-    if encode is not None:
-        t = encode(t)
-    if isinstance(t, Mapping):
-        if t:
-            for k in t:
-                k_ = k if key is None else ".".join((key, k))
-                yield from _nested_dicts_to_dotted_keys(t[k], encode=encode, key=k_)
-        elif key is not None:
-            yield key, t
-    else:
-        yield key, t
+
+    def _items(prefix, mapping):
+        for k in mapping:
+            yield (k if prefix is None else ".".join((prefix, k))), mapping[k]
+
+    stack = [iter(((key, t),))]
+    while stack:
+        for k, v in stack[-1]:
+            if encode is not None:
+                v = encode(v)
+            if isinstance(v, Mapping):
+                if v:
+                    stack.append(_items(k, v))
+                    break
+                elif k is None:
+                    continue
+            yield k, v
+        else:
+            stack.pop()
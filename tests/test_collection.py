@@ -1,6 +1,7 @@
 import array
 import io
 import os
+import re
 from collections import OrderedDict
 from itertools import islice
 from tempfile import TemporaryDirectory
@@ -505,6 +506,9 @@ class TestCollection:
         assert self.c.find({"a": {"$near": (10)}}).count() == 0
         assert self.c.find({"a": {"$near": (10, 100)}}).count() == 0
         assert self.c.find({"a": {"$near": (10, 100, 100)}}).count() == 0
+        # invalid arguments are rejected even if no value is indexed
+        with pytest.raises(ValueError):
+            self.c.find({"a": {"$near": [10, 0.5, 1, 1]}})
         self.c.update(ARITHMETIC_DOCS)
         assert len(self.c) == len(ARITHMETIC_DOCS)
         # test known cases with lists and tuples
@@ -552,6 +556,8 @@ class TestCollection:
         assert len(self.c) == 0
         assert len(self.c.find({"a": {"$regex": "foo"}})) == 0
         assert len(self.c.find({"a": {"$regex": "hello"}})) == 0
+        with pytest.raises(re.error):
+            self.c.find({"a": {"$regex": "("}})
         self.c.update([{"a": "hello world"}])
         assert len(self.c.find({"a": {"$regex": "foo"}})) == 0
         assert len(self.c.find({"a": {"$regex": "hello"}})) == 1
@@ -568,6 +574,8 @@ class TestCollection:
         ]
         for (v, t) in types:
             assert len(self.c.find({"a": {"$type": t}})) == 0
+        with pytest.raises(ValueError):
+            self.c.find({"a": {"$type": "foo"}})
         for i, (v, t) in enumerate(types):
             self.c.insert_one({str(i): v})
         assert len(self.c) == len(types)
@@ -230,6 +230,22 @@ class TestProject(TestProjectBase):
             with pytest.warns(FutureWarning):
                 self.project.get_statepoint(id_)
 
+    def test_write_statepoints_unchanged(self):
+        statepoints = [{"a": i} for i in range(5)]
+        self.project.write_statepoints(statepoints)
+        fn = self.project.fn(self.project.FN_STATEPOINTS)
+        mtime = os.stat(fn).st_mtime_ns
+        os.utime(fn, ns=(mtime - 10**9, mtime - 10**9))
+        self.project.write_statepoints(statepoints[:2])
+        assert os.stat(fn).st_mtime_ns == mtime - 10**9
+        self.project.write_statepoints(statepoints[:2], indent=4)
+        with open(fn) as file:
+            assert file.read().startswith('{\n    "')
+        os.utime(fn, ns=(mtime - 10**9, mtime - 10**9))
+        self.project.write_statepoints([{"b": 0}])
+        assert os.stat(fn).st_mtime_ns != mtime - 10**9
+        assert len(self.project.read_statepoints()) == len(statepoints) + 1
+
     def test_workspace_path_normalization(self):
         def norm_path(p):
             return os.path.abspath(os.path.expandvars(p))
@@ -330,6 +346,39 @@ class TestProject(TestProjectBase):
         assert 1 == len(list(self.project.find_jobs({"a": 0})))
         assert 0 == len(list(self.project.find_jobs({"a": 5})))
 
+    def test_find_jobs_after_workspace_changes(self):
+        for i in range(5):
+            self.project.open_job({"a": i}).init()
+        assert len(self.project.find_jobs({"a": 2})) == 1
+        self.project.open_job({"a": 2}).remove()
+        assert len(self.project.find_jobs({"a": 2})) == 0
+        assert len(self.project.find_jobs({"a": {"$lt": 5}})) == 4
+        self.project.open_job({"a": 5}).init()
+        assert len(self.project.find_jobs({"a": 5})) == 1
+        assert len(self.project.find_jobs({"a": {"$lt": 5}})) == 4
+
+    def test_find_jobs_counts_cache_misses(self):
+        for num_jobs in (1, 50):
+            for i in range(num_jobs):
+                self.project.open_job({"a": i}).init()
+            self.project._remove_persistent_cache_file()
+            project = type(self.project).get_project(root=self.project.root_directory())
+            assert len(project.find_jobs({"a": 0})) == 1
+            assert project._sp_cache_misses == num_jobs
+
+    def test_large_integer_statepoints(self):
+        statepoints = [{"seed": 2**64 + 1}, {"seed": -(2**63) - 1}]
+        jobs = [self.project.open_job(sp).init() for sp in statepoints]
+        self.project.update_cache()
+        self.project.write_statepoints()
+        project = type(self.project).get_project(root=self.project.root_directory())
+        for job, sp in zip(jobs, statepoints):
+            assert project._get_statepoint(job.id) == sp
+            assert type(project._get_statepoint(job.id)["seed"]) is int
+            assert project.read_statepoints()[job.id] == sp
+            assert list(project.find_jobs(sp)) == [job]
+        assert len(project.find_jobs({"seed": float(2**64)})) == 0
+
     def test_find_jobs_JobsCursor_contains(self):
         statepoints = [{"a": i} for i in range(5)]
         for sp in statepoints:
@@ -0,0 +1,114 @@
+# Copyright (c) 2022 The Regents of the University of Michigan
+# All rights reserved.
+# This software is licensed under the BSD 3-Clause License.
+import json
+import math
+from collections import OrderedDict
+
+import pytest
+
+from signac.contrib import utility
+from signac.contrib.utility import _json_dumps, _json_loads
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def orjson_enabled(request, monkeypatch):
+    if request.param and not utility.ORJSON:
+        pytest.skip("orjson not available.")
+    monkeypatch.setattr(utility, "ORJSON", request.param)
+    return request.param
+
+
+class TestJSONLoads:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            0,
+            2**63 - 1,
+            -(2**63),
+            2**64,
+            2**64 + 1,
+            -(2**63) - 1,
+            -(2**70),
+            1.5,
+            None,
+            "a string",
+            [1, [2, {"b": None}]],
+        ],
+    )
+    def test_roundtrip(self, orjson_enabled, value):
+        doc = {"a": value}
+        decoded = _json_loads(json.dumps(doc).encode())
+        assert decoded == doc
+        assert type(decoded["a"]) is type(value)
+
+    @pytest.mark.parametrize("value", [2**64 + 1, -(2**63) - 1])
+    def test_large_integer_formatting(self, orjson_enabled, value):
+        for data in (f"{value}", f"[ {value}]", f'{{"a":\n  {value}}}'):
+            assert _json_loads(data.encode()) == json.loads(data)
+
+    def test_digit_run_in_string(self, orjson_enabled):
+        _id = "1234567890123456789" + "a" * 13
+        doc = {_id: {"a": 1, "b": _id}}
+        data = json.dumps(doc).encode()
+        # Job ids must not force the fallback to the standard library.
+        assert not utility._may_contain_long_integer(data)
+        assert _json_loads(data) == doc
+
+    @pytest.mark.parametrize("value", [float("inf"), float("-inf")])
+    def test_infinity(self, orjson_enabled, value):
+        assert _json_loads(json.dumps({"a": value}).encode()) == {"a": value}
+
+    def test_nan(self, orjson_enabled):
+        assert math.isnan(_json_loads(b'{"a": NaN}')["a"])
+
+    def test_invalid(self, orjson_enabled):
+        with pytest.raises(ValueError):
+            _json_loads(b'{"a": ')
+
+
+class TestJSONDumps:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            0,
+            2**63 - 1,
+            2**64 + 1,
+            -(2**63) - 1,
+            1.5,
+            None,
+            "null",
+            [1, [2, {"b": None}]],
+        ],
+    )
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_roundtrip(self, orjson_enabled, value, indent):
+        doc = {"a": value}
+        assert json.loads(_json_dumps(doc, indent=indent)) == doc
+
+    @pytest.mark.parametrize("value", [float("inf"), float("-inf")])
+    def test_infinity(self, orjson_enabled, value):
+        data = _json_dumps({"a": [{"b": value}]}, indent=2)
+        assert data == json.dumps({"a": [{"b": value}]}, indent=2).encode()
+
+    def test_nan(self, orjson_enabled):
+        data = _json_dumps({"a": (1, float("nan"))}, indent=2)
+        assert math.isnan(json.loads(data)["a"][1])
+
+    def test_non_finite_in_subclasses(self, orjson_enabled):
+        class _List(list):
+            pass
+
+        doc = {"a": OrderedDict(b=float("nan")), "c": _List([float("inf")])}
+        decoded = json.loads(_json_dumps(doc, indent=2))
+        assert math.isnan(decoded["a"]["b"])
+        assert decoded["c"] == [float("inf")]
+
+    def test_indent(self, orjson_enabled):
+        doc = {"a": [1, {"b": None}], "c": "\u00fc"}
+        assert json.loads(_json_dumps(doc, indent=2)) == doc
+        assert _json_dumps(doc, indent=4) == json.dumps(doc, indent=4).encode()
+
+    def test_not_serializable(self, orjson_enabled):
+        with pytest.raises(TypeError):
+            _json_dumps({"a": object()})